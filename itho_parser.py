@@ -1,11 +1,22 @@
 import os
+import io
+import sys
+import hashlib
+import csv
 import sqlite3
 import logging
 import re
 import yaml
 from subprocess import Popen, PIPE
-from tempfile import TemporaryDirectory
-from shutil import which, copy
+from itertools import islice
+from dataclasses import dataclass, fields
+from concurrent.futures import ThreadPoolExecutor
+from shutil import which
+
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
 
 from homeassistant.components.sensor.const import (
     SensorDeviceClass,
@@ -17,8 +28,9 @@ from homeassistant.components.sensor.const import (
 class folded_str(str): pass
 
 def folded_string_representer(dumper, data):
-    return dumper.represent_scalar(u'tag:yaml.org,2002:str', data, style='>')
+    return dumper.represent_scalar(u'tag:yaml.org,2002:str', str(data), style='>')
 yaml.add_representer(folded_str, folded_string_representer)
+yaml.add_representer(folded_str, folded_string_representer, Dumper=_Dumper)
 
 DEVICE_ID = "itho_432432"
 ROOT_TOPIC = "itho_wtw"
@@ -30,6 +42,24 @@ PAYLOAD_NOT_AVAILABLE = "offline"
 # Directory where parameter files are located
 PARAMETER_DIR = "parameters"
 
+# Directory where converted parameter files are cached
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "itho_parser")
+
+# Date format used when exporting tables from the parameter file
+EXPORT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Number of rows inserted per executemany call
+INSERT_BATCH_SIZE = 5000
+
+# Number of rows fetched per fetchmany call
+FETCH_BATCH_SIZE = 1000
+
+# Text values up to this many bytes are interned when read from the database
+INTERN_MAX_LENGTH = 16
+
+# Matches the version suffix of versioned table names, e.g. Datalabel_V12
+_VERSION_RE = re.compile(r"_V(\d{1,2})$")
+
 # Use a subset of avilable device classes
 DEVICE_CLASSES = [
     SensorDeviceClass.APPARENT_POWER,
@@ -49,7 +79,43 @@ class HAMQTTSensorError(Exception):
     pass
 
 
+# Shared prefix and suffix of the sensor value templates
+_VT_PRE = '{{ value_json["'
+_VT_POST = '"] }}'
+
+# Fixes for common mistakes in units: unit -> (unit, fixed unit)
+_UNIT_FIXES: dict[str, tuple[str, str | None]] = {
+    "M3/h": ("m3/h", "m³/h"),
+    "m3/h": ("m3/h", "m³/h"),
+    "m³/h": ("m3/h", "m³/h"),
+    "uur": ("hour", "h"),
+    "-": ("-", None),
+}
+
+# Lookup of unit to device class for the subset of device classes
+_UNIT_TO_DEVICE_CLASS: dict[str, SensorDeviceClass] = {}
+for _device_class in DEVICE_CLASSES:
+    for _unit in DEVICE_CLASS_UNITS[_device_class]:
+        if _unit in _UNIT_TO_DEVICE_CLASS:
+            raise HAMQTTSensorError(f"Multiple device classes found for unit: {_unit}")
+        _UNIT_TO_DEVICE_CLASS[_unit] = _device_class
+
+
 class HAMQTTSensor:
+    __slots__ = (
+        "name",
+        "unique_id",
+        "availability_topic",
+        "payload_available",
+        "payload_not_available",
+        "state_topic",
+        "value_template",
+        "device_class",
+        "state_class",
+        "unit_of_measurement",
+        "fixed_unit_of_measurement",
+    )
+
     name: str
     unique_id: str
 
@@ -60,10 +126,10 @@ class HAMQTTSensor:
     state_topic: str
     value_template: str
 
-    device_class: SensorDeviceClass | None = None
-    state_class: SensorStateClass | None = None
-    unit_of_measurement: str | None = None
-    fixed_unit_of_measurement: str | None = None
+    device_class: SensorDeviceClass | None
+    state_class: SensorStateClass | None
+    unit_of_measurement: str | None
+    fixed_unit_of_measurement: str | None
 
     def __init__(
         self,
@@ -80,7 +146,10 @@ class HAMQTTSensor:
         self.name = name
         self.unique_id = unique_id
 
+        self.device_class = None
+        self.state_class = None
         self.unit_of_measurement = unit_of_measurement
+        self.fixed_unit_of_measurement = None
 
         if self.unit_of_measurement:
             self.__fix_unit()
@@ -102,7 +171,7 @@ class HAMQTTSensor:
         if enumerations:
             self.value_template = f'{{% set v = value_json["{value}] | int %}}\n'
             for index, enum in enumerate(enumerations):
-                logger.debug(f"id: {enum['index']} - {enum['value']}")    
+                logger.debug("id: %s - %s", enum["index"], enum["value"])
                 if index == 0:
                     self.value_template += f'{{% if v == {enum["index"]} %}}\n'
                 else:
@@ -117,43 +186,27 @@ class HAMQTTSensor:
 
 
         else:
-            self.value_template = f'{{{{ value_json["{value} ({self.unit_of_measurement})"] }}}}'
+            self.value_template = f"{_VT_PRE}{value} ({self.unit_of_measurement}){_VT_POST}"
 
     def __fix_unit(self) -> None:
         """Fixes common mistakes in units"""
-        if self.unit_of_measurement == "M3/h":
-            self.unit_of_measurement = "m3/h"
-            self.fixed_unit_of_measurement = "m³/h"
-        elif self.unit_of_measurement == "m3/h":
-            self.fixed_unit_of_measurement = "m³/h"
-        elif self.unit_of_measurement == "m³/h":
-            self.unit_of_measurement = "m3/h"
-            self.fixed_unit_of_measurement = "m³/h"
-        elif self.unit_of_measurement == "uur":
-            self.unit_of_measurement = "hour"
-            self.fixed_unit_of_measurement = "h"
-        elif self.unit_of_measurement == "-":
-            self.fixed_unit_of_measurement = None
+        fix = _UNIT_FIXES.get(self.unit_of_measurement)
+        if fix:
+            self.unit_of_measurement, self.fixed_unit_of_measurement = fix
         else:
             self.fixed_unit_of_measurement = self.unit_of_measurement
 
     def __find_device_class(self) -> None:
         """Finds device class based on unit"""
-        device_classes = [device_class for device_class in DEVICE_CLASSES if self.fixed_unit_of_measurement in DEVICE_CLASS_UNITS[device_class]]
-
-        if not len(device_classes):
-            self.device_class = None
-        elif len(device_classes) == 1:
-            self.device_class = device_classes[0]
-        else:
-            raise HAMQTTSensorError("Multiple device classes found!")
+        self.device_class = _UNIT_TO_DEVICE_CLASS.get(self.fixed_unit_of_measurement)
 
     def to_dict(self) -> dict:
-        sensor = {}
-        sensor["name"] = self.name
-        sensor["unique_id"] = self.unique_id
-        sensor["state_topic"] = self.state_topic
-        sensor["value_template"] = self.value_template
+        sensor = {
+            "name": self.name,
+            "unique_id": self.unique_id,
+            "state_topic": self.state_topic,
+            "value_template": self.value_template,
+        }
         if self.fixed_unit_of_measurement:
             sensor["unit_of_measurement"] = self.fixed_unit_of_measurement
 
@@ -174,85 +227,52 @@ class IthoParserError(Exception):
     pass
 
 
+@dataclass(slots=True)
 class IthoParameter:
-    def __init__(
-        self,
-        Index: int,
-        Volgorde: int,
-        Naam: str,
-        Naam_fabriek: str,
-        Min: float,
-        Max: float,
-        Default: float,
-        Tekst_NL: str,
-        Omschrijving_NL: str,
-        Eenheid_NL: str,
-        Tekst_GB: str,
-        Omschrijving_GB: str,
-        Eenheid_GB: str,
-        Tekst_D: str,
-        Omschrijving_D: str,
-        Eenheid_D: str,
-        Subtabel: str,
-        Paswoordnivo: int,
-    ):
-        self.Index = Index
-        self.Volgorde = Volgorde
-        self.Naam = Naam
-        self.Naam_fabriek = Naam_fabriek
-        self.Min = Min
-        self.Max = Max
-        self.Default = Default
-        self.Tekst_NL = Tekst_NL
-        self.Omschrijving_NL = Omschrijving_NL
-        self.Eenheid_NL = Eenheid_NL
-        self.Tekst_GB = Tekst_GB
-        self.Omschrijving_GB = Omschrijving_GB
-        self.Eenheid_GB = Eenheid_GB
-        self.Tekst_D = Tekst_D
-        self.Omschrijving_D = Omschrijving_D
-        self.Eenheid_D = Eenheid_D
-        self.Subtabel = Subtabel
-        self.Paswoordnivo = Paswoordnivo
-
-
+    Index: int
+    Volgorde: int
+    Naam: str
+    Naam_fabriek: str
+    Min: float
+    Max: float
+    Default: float
+    Tekst_NL: str
+    Omschrijving_NL: str
+    Eenheid_NL: str
+    Tekst_GB: str
+    Omschrijving_GB: str
+    Eenheid_GB: str
+    Tekst_D: str
+    Omschrijving_D: str
+    Eenheid_D: str
+    Subtabel: str
+    Paswoordnivo: int
+
+
+@dataclass(slots=True)
 class IthoDatalabel:
-    def __init__(
-        self,
-        Index: int,
-        Naam: str,
-        Tekst_NL: str,
-        Tooltip_NL: str,
-        Eenheid_NL: str,
-        Tekst_GB: str,
-        Tooltip_GB: str,
-        Eenheid_GB: str,
-        Tekst_D: str,
-        Tooltip_D: str,
-        Eenheid_D: str,
-        SubTabel: str,
-        Visible: int,
-        enumerations: list[dict] = None,
-    ):
-        self.Index = Index
-        self.Naam = Naam
-        self.Tekst_NL = Tekst_NL
-        self.Tooltip_NL = Tooltip_NL
-        self.Eenheid_NL = Eenheid_NL
-        self.Tekst_GB = Tekst_GB
-        self.Tooltip_GB = Tooltip_GB
-        self.Eenheid_GB = Eenheid_GB
-        self.Tekst_D = Tekst_D
-        self.Tooltip_D = Tooltip_D
-        self.Eenheid_D = Eenheid_D
-        self.SubTabel = SubTabel
-        self.Visible = Visible
-        self.enumerations = enumerations
+    """Datalabel columns used to build the Home Assistant sensors"""
+
+    Index: int
+    Naam: str
+    Tekst_GB: str
+    Tooltip_GB: str
+    Eenheid_GB: str
+    SubTabel: str
+    enumerations: list[dict] | None = None
 
     def __str__(self):
         return f"{self.Index} | {self.Naam} | {self.Tekst_GB} | {self.Tooltip_GB} | {self.Eenheid_GB}"
 
 
+def _intern_text(value: bytes) -> str:
+    """Decodes a text value, interning short values like units and subtables"""
+    text = value.decode("utf-8")
+    if len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(text)
+    return text
+
+
 class IthoParser:
     connection = None
 
@@ -263,176 +283,244 @@ class IthoParser:
         self.parameters: dict = {}
         self.datalabels: dict = {}
         self.tables: list[str] = []
+        self._table_set: set[str] = set()
+        self._sensors_cache: dict[str, list[HAMQTTSensor]] = {}
+        self.parameter_file = parameter_file
 
-        if not which("mdb-schema"):
-            raise IthoParserError("`mdb-schema` executable not found. Make sure mdbtools is installed and in PATH")
-
-        self.temp_dir = TemporaryDirectory()
-
-        file = os.path.split(parameter_file)[1]
-        if file.endswith(".par"):
-            file = file.replace(".par", ".mdb")
-        tmp_file = os.path.join(self.temp_dir.name, file)
+        # Converted parameter files are cached by the hash of their content
         try:
-            copy(parameter_file, tmp_file)
+            with open(parameter_file, "rb") as file:
+                key = hashlib.sha256(file.read()).hexdigest()[:16]
         except FileNotFoundError as err:
             raise IthoParserError(f"Parameter file not found: {parameter_file}") from err
 
-        self.parameter_file = tmp_file
-        self.logger.debug(f"Created temporary file: {tmp_file}")
+        self.cache_file = os.path.join(CACHE_DIR, f"{key}.sqlite")
+        self.cached = os.path.exists(self.cache_file)
+
+        if self.cached:
+            self.connection = sqlite3.connect(self.cache_file)
+            self.logger.debug("Using cached database: %s", self.cache_file)
+        else:
+            if not which("mdb-schema"):
+                raise IthoParserError("`mdb-schema` executable not found. Make sure mdbtools is installed and in PATH")
+
+            # Create destination sqlite database, transactions are handled by parse()
+            self.connection = sqlite3.connect(":memory:", isolation_level=None)
+            self.connection.executescript(
+                """
+                PRAGMA journal_mode=OFF;
+                PRAGMA synchronous=OFF;
+                PRAGMA locking_mode=EXCLUSIVE;
+                PRAGMA temp_store=MEMORY;
+                """
+            )
 
-        # Create destination sqlite database
-        self.connection = sqlite3.connect(":memory:")
         self.connection.row_factory = sqlite3.Row
+        # Short text values repeat across rows, share a single object for each
+        self.connection.text_factory = _intern_text
         self.cursor = self.connection.cursor()
 
-    def __del__(self):
+    def __enter__(self) -> "IthoParser":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the sqlite database"""
         if self.connection:
             self.connection.commit()
             self.connection.close()
+            self.connection = None
 
     def parse(self) -> None:
         """Converts the parameter file to an sqlite database
 
         Steps:
-        1. Create a directory to hold the temporary table exports
-        2. Extract the database schema and save to file
-        3. Extract all the table names and skip the ones starting with "~"
-        4. Apply the exported database schema to the new database
-        5. Import each table
+        1. Extract the database schema
+        2. Extract all the table names and skip the ones starting with "~"
+        3. Apply the exported database schema to the new database
+        4. Import each table
+        5. Save the database to the cache
+
+        When the parameter file was converted before, only the table names
+        are read from the cached database.
 
         """
-        file_name = os.path.split(self.parameter_file)[1].split(".")[0]
-        table_dir = os.path.join(self.temp_dir.name, file_name)
-        os.makedirs(table_dir)
-        self.logger.debug(f"Created temporary table directory: {table_dir}")
-
-        # Export database schema
-        schema_file = os.path.join(table_dir, "schema.sqlite")
-        with open(schema_file, "wb") as schema:
-            schema_command = ["mdb-schema", self.parameter_file, "sqlite"]
-            proces = Popen(schema_command, stdout=schema, stderr=PIPE)
-            _, std_error = proces.communicate()
+        self._sensors_cache = {}
+
+        if self.cached:
+            result = self.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY rowid")
+            tables = [row["name"] for row in result]
+            self.tables = [table for table in tables if not table.startswith(("~", "sqlite_"))]
+            self._table_set = set(self.tables)
+            return
+
+        # Every mdbtools call opens the parameter file again, so run them
+        # concurrently and only serialize the inserts
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # The schema does not depend on the table names, export it alongside them
+            schema_export = executor.submit(self._export_schema)
+
+            # Get table names
+            tables_command = ["mdb-tables", "-1", self.parameter_file]
+            proces = Popen(tables_command, stdout=PIPE, stderr=PIPE)
+            std_out, std_error = proces.communicate()
             if std_error:
-                raise IthoParserError(f"Failed to export schema: {std_error}")
-        self.logger.debug(f"Exported database schema to {schema_file}")
+                raise IthoParserError(f"Failed to get database tables: {std_error}")
+            tables = std_out.decode("ascii").strip().split("\n")
 
-        # Get table names
-        tables_command = ["mdb-tables", "-1", self.parameter_file]
-        proces = Popen(tables_command, stdout=PIPE, stderr=PIPE)
-        std_out, std_error = proces.communicate()
-        if std_error:
-            raise IthoParserError(f"Failed to get database tables: {std_error}")
-        tables = std_out.decode("ascii").strip().split("\n")
+            # Filter temporary tables starting with "~"
+            self.tables = [table for table in tables if not table.startswith("~")]
+            self._table_set = set(self.tables)
+            for table in self.tables:
+                self.logger.debug("Found database table: %s", table)
 
-        # Filter temporary tables starting with "~"
-        self.tables = [table for table in tables if not table.startswith("~")]
-        for table in self.tables:
-            self.logger.debug(f"Found database table: {table}")
-
-        # Apply database schema
-        with open(schema_file, "r") as schema:
-            self.cursor.executescript(schema.read())
-
-        self.connection.commit()
-
-        # Export tables to sql and insert into destination database
-        for table_name in self.tables:
-            table_file = os.path.join(table_dir, f"{table_name}.sql")
-            export_command = [
-                "mdb-export",
-                "-D",
-                "'%Y-%m-%d %H:%M:%S'",
-                "-q",
-                "'",
-                "-H",
-                "-I",
-                "sqlite",
-                self.parameter_file,
-                table_name,
-            ]
-            with open(table_file, "wb") as table:
-                proces = Popen(export_command, stdout=table, stderr=PIPE)
-                _, std_error = proces.communicate()
-                if std_error:
-                    raise IthoParserError(f"Failed to convert table: {table_name} with error: {std_error}")
+            # Export tables to csv
+            exports = executor.map(self._export_table, self.tables)
+
+            # Apply database schema, executescript() commits any open transaction
+            # first so the transaction for the whole load is started in the script
+            schema = schema_export.result()
+            self.cursor.executescript(f"BEGIN;\n{schema.decode('utf-8')}")
 
             # Insert into destination database
-            with open(table_file, "r") as table:
-                sql = table.read()
-                self.cursor.executescript(sql)
-            self.logger.debug(f"Converted table: {table_name}")
+            for table_name, data in exports:
+                columns = self.cursor.execute(f'PRAGMA table_info("{table_name}")').fetchall()
+                query = f'INSERT INTO "{table_name}" VALUES ({", ".join("?" * len(columns))})'
+                reader = csv.reader(io.StringIO(data.decode("utf-8"), newline=""))
+                # Empty csv fields are NULL values in the parameter file
+                rows = ([value if value != "" else None for value in row] for row in reader)
 
-        self.connection.commit()
+                while batch := list(islice(rows, INSERT_BATCH_SIZE)):
+                    self.cursor.executemany(query, batch)
+                self.logger.debug("Converted table: %s", table_name)
+
+        self.cursor.execute("COMMIT")
+
+        self._save_cache()
+
+    def _save_cache(self) -> None:
+        """Saves the converted database to the cache directory"""
+        tmp_cache_file = f"{self.cache_file}.tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            cache = sqlite3.connect(tmp_cache_file)
+            try:
+                self.connection.backup(cache)
+            finally:
+                cache.close()
+            os.replace(tmp_cache_file, self.cache_file)
+        except (OSError, sqlite3.Error) as err:
+            self.logger.warning("Failed to save cached database %s: %s", self.cache_file, err)
+            return
+        self.logger.debug("Saved cached database: %s", self.cache_file)
+
+    def _export_schema(self) -> bytes:
+        """Exports the database schema from the parameter file"""
+        schema_command = ["mdb-schema", self.parameter_file, "sqlite"]
+        proces = Popen(schema_command, stdout=PIPE, stderr=PIPE)
+        schema, std_error = proces.communicate()
+        if std_error:
+            raise IthoParserError(f"Failed to export schema: {std_error}")
+        self.logger.debug("Exported database schema")
+        return schema
+
+    def _export_table(self, table_name: str) -> tuple[str, bytes]:
+        """Exports a single table from the parameter file as csv"""
+        export_command = [
+            "mdb-export",
+            "-D",
+            EXPORT_DATE_FORMAT,
+            "-T",
+            EXPORT_DATE_FORMAT,
+            "-H",
+            self.parameter_file,
+            table_name,
+        ]
+        proces = Popen(export_command, stdout=PIPE, stderr=PIPE)
+        std_out, std_error = proces.communicate()
+        if std_error:
+            raise IthoParserError(f"Failed to convert table: {table_name} with error: {std_error}")
+        return table_name, std_out
 
     def find_versions(self) -> None:
         """Find versions based on table names"""
-        version_match = ".+V[0-9]{1,2}$"
         max_version = 0
-        version_tables = [table for table in self.tables if re.match(version_match, table)]
-        for table in version_tables:
-            version = int(table.split("_V")[-1])
-            if version > max_version:
-                max_version = version
+        for table in self.tables:
+            match = _VERSION_RE.search(table)
+            if match:
+                max_version = max(max_version, int(match.group(1)))
 
         self.versions = [version for version in range(1, max_version + 1, 1)]
         self.logger.debug(f"Found versions: {self.versions}")
 
     def find_parameters(self) -> None:
-        """Find parameters for each version"""
+        """Find parameters for each version
+
+        Only needed when reading `self.parameters`, the Home Assistant sensors
+        are built from the datalabels alone.
+
+        """
 
         current_table = ""
         for version in self.versions:
-            self.logger.debug(f"Finding parameters for version {version}")
+            self.logger.debug("Finding parameters for version %s", version)
 
-            if f"Parameterlijst_V{version}" in self.tables:
+            if f"Parameterlijst_V{version}" in self._table_set:
                 current_table = f"Parameterlijst_V{version}"
-            elif f"parameterlijst_V{version}" in self.tables:
+            elif f"parameterlijst_V{version}" in self._table_set:
                 current_table = f"Parameterlijst_V{version}"
 
-            self.logger.debug(f"Using table: {current_table}")
+            self.logger.debug("Using table: %s", current_table)
 
-            query = f'SELECT * FROM {current_table} ORDER BY "Index" ASC'
+            # Select the columns explicitly so they match the field order
+            columns = ", ".join(f'"{field.name}"' for field in fields(IthoParameter))
+            query = f'SELECT {columns} FROM {current_table} ORDER BY "Index" ASC'
             result = self.cursor.execute(query)
 
             new_parameters = []
-            for parameter in result:
-                new_parameter = IthoParameter(**parameter)
-                new_parameters.append(new_parameter)
-                self.logger.debug(f"Found parameter id: {parameter['Index']} name: {parameter['Tekst_GB']}")
+            while rows := result.fetchmany(FETCH_BATCH_SIZE):
+                for row in rows:
+                    new_parameter = IthoParameter(*row)
+                    new_parameters.append(new_parameter)
+                    self.logger.debug("Found parameter id: %s name: %s", new_parameter.Index, new_parameter.Tekst_GB)
             self.parameters[version] = new_parameters
 
     def find_datalabels(self) -> None:
         """Find datalabels for each version"""
 
+        self._sensors_cache = {}
         current_table = ""
         for version in self.versions:
-            self.logger.debug(f"Finding datalabels for version {version}")
+            self.logger.debug("Finding datalabels for version %s", version)
 
-            if f"Datalabel_V{version}" in self.tables:
+            if f"Datalabel_V{version}" in self._table_set:
                 current_table = f"Datalabel_V{version}"
 
-            self.logger.debug(f"Using table: {current_table}")
+            self.logger.debug("Using table: %s", current_table)
 
-            query = f'SELECT * FROM {current_table} ORDER BY "Index" ASC'
+            # Select the columns explicitly so they match the field order
+            columns = ", ".join(f'"{field.name}"' for field in fields(IthoDatalabel) if field.name != "enumerations")
+            query = f'SELECT {columns} FROM {current_table} ORDER BY "Index" ASC'
             result = self.cursor.execute(query)
 
             new_datalabels = []
-            for datalabel in result:
+            while rows := result.fetchmany(FETCH_BATCH_SIZE):
+                for row in rows:
+                    new_datalabel = IthoDatalabel(*row)
+                    if new_datalabel.SubTabel:
+                        self.logger.debug("Datalabel: %s has subtabel: %s", new_datalabel.Tekst_GB, new_datalabel.SubTabel)
+                        if "errors" in new_datalabel.SubTabel.lower():
+                            enums = self.get_errors()
+                        else:
+                            enums = self.get_enums(new_datalabel.SubTabel)
 
-                new_datalabel = IthoDatalabel(**datalabel)
-                if datalabel["SubTabel"]:
-                    self.logger.debug(f"Datalabel: {datalabel['Tekst_GB']} has subtabel: {datalabel['SubTabel']}")
-                    if "errors" in datalabel["SubTabel"].lower():
-                        enums = self.get_errors()
-                    else:
-                        enums = self.get_enums(datalabel["SubTabel"])
-                    
-                    new_datalabel.enumerations = enums
+                        new_datalabel.enumerations = enums
 
-                new_datalabels.append(new_datalabel)
+                    new_datalabels.append(new_datalabel)
 
-                self.logger.debug(f"Found datalabel {str(new_datalabel)}")
+                    self.logger.debug("Found datalabel %s", new_datalabel)
             self.datalabels[version] = new_datalabels
 
     def get_enums(self, table: str) -> list[dict]:
@@ -453,6 +541,9 @@ class IthoParser:
         if not version in self.versions:
             raise IthoParserError(f"Firmware version: {version} not found")
 
+        if version in self._sensors_cache:
+            return self._sensors_cache[version]
+
         sensors = []
         for datalabel in self.datalabels[version]:
             if not datalabel.Tooltip_GB:
@@ -474,6 +565,7 @@ class IthoParser:
             )
             sensors.append(sensor)
 
+        self._sensors_cache[version] = sensors
         return sensors
 
 
@@ -482,17 +574,17 @@ if __name__ == "__main__":
 
     logger = logging.getLogger(__name__)
 
-    p = IthoParser(os.path.join(PARAMETER_DIR, "$_parameters_HRU250-300.par"))
-    p.parse()
-    p.find_versions()
-    p.find_parameters()
-    p.find_datalabels()
-    versions = p.get_versions()
-    sensors = p.get_ha_sensors(versions[-1])
+    with IthoParser(os.path.join(PARAMETER_DIR, "$_parameters_HRU250-300.par")) as p:
+        p.parse()
+        p.find_versions()
+        p.find_datalabels()
+        versions = p.get_versions()
+        sensors = p.get_ha_sensors(versions[-1])
 
     print(
         yaml.dump(
             {"sensor": [sensor.to_dict() for sensor in sensors]},
+            Dumper=_Dumper,
             allow_unicode=True,
             sort_keys=False,
             width=1000,